@@ -12,29 +12,35 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-import tempfile
-import unittest
+from functools import lru_cache
 from pathlib import Path
 from textwrap import dedent
 from typing import Any, Dict, List, Optional, Tuple, Union
-from unittest.mock import MagicMock, patch
+from unittest.mock import Mock, patch
 
-import mcp
 import numpy as np
 import pytest
-import torch
-from transformers import is_torch_available, is_vision_available
-from transformers.testing_utils import get_tests_dir
 
 from smolagents.agent_types import _AGENT_TYPE_MAPPING, AgentAudio, AgentImage, AgentText
 from smolagents.tools import AUTHORIZED_TYPES, Tool, ToolCollection, tool
 
 
-if is_torch_available():
-    import torch
+# Heavy optional dependencies (torch, PIL, mcp, transformers) are imported where they are used, so that collecting
+# this module stays cheap
+
 
-if is_vision_available():
+@lru_cache(maxsize=1)
+def _load_fixture_image():
+    # Decode and resize the fixture once; `create_inputs` hands out copies
     from PIL import Image
+    from transformers.testing_utils import get_tests_dir
+
+    # Tests check plumbing rather than pixel fidelity, so the cheapest resampling filter is enough
+    image = Image.open(Path(get_tests_dir("fixtures")) / "000000039769.png").resize(
+        (512, 512), Image.Resampling.NEAREST
+    )
+    image.load()
+    return image
 
 
 def create_inputs(tool_inputs: Dict[str, Dict[Union[str, type], str]]):
@@ -46,9 +52,10 @@ def create_inputs(tool_inputs: Dict[str, Dict[Union[str, type], str]]):
         if input_type == "string":
             inputs[input_name] = "Text input"
         elif input_type == "image":
-            inputs[input_name] = Image.open(Path(get_tests_dir("fixtures")) / "000000039769.png").resize((512, 512))
+            inputs[input_name] = _load_fixture_image().copy()
         elif input_type == "audio":
-            inputs[input_name] = np.ones(3000)
+            # Samples are never inspected, so the smallest valid waveform is enough
+            inputs[input_name] = np.ones(1, dtype=np.float32)
         else:
             raise ValueError(f"Invalid type requested: {input_type}")
 
@@ -58,36 +65,41 @@ def create_inputs(tool_inputs: Dict[str, Dict[Union[str, type], str]]):
 def output_type(output):
     if isinstance(output, (str, AgentText)):
         return "string"
-    elif isinstance(output, (Image.Image, AgentImage)):
+    if isinstance(output, AgentImage):
         return "image"
-    elif isinstance(output, (torch.Tensor, AgentAudio)):
+    if isinstance(output, AgentAudio):
         return "audio"
-    else:
-        raise TypeError(f"Invalid output: {output}")
 
+    from PIL import Image
 
-class ToolTesterMixin:
-    def test_inputs_output(self):
-        self.assertTrue(hasattr(self.tool, "inputs"))
-        self.assertTrue(hasattr(self.tool, "output_type"))
+    if isinstance(output, Image.Image):
+        return "image"
 
-        inputs = self.tool.inputs
-        self.assertTrue(isinstance(inputs, dict))
+    import torch
+
+    if isinstance(output, torch.Tensor):
+        return "audio"
+    raise TypeError(f"Invalid output: {output}")
 
-        for _, input_spec in inputs.items():
-            self.assertTrue("type" in input_spec)
-            self.assertTrue("description" in input_spec)
-            self.assertTrue(input_spec["type"] in AUTHORIZED_TYPES)
-            self.assertTrue(isinstance(input_spec["description"], str))
 
-        output_type = self.tool.output_type
-        self.assertTrue(output_type in AUTHORIZED_TYPES)
+def assert_valid_tool_metadata(tool):
+    """Checks that a tool exposes a name, a description, well-formed `inputs` and an authorized `output_type`."""
+    for attribute in ["name", "description", "inputs", "output_type"]:
+        assert hasattr(tool, attribute), f"Tool is missing attribute {attribute}"
 
-    def test_common_attributes(self):
-        self.assertTrue(hasattr(self.tool, "description"))
-        self.assertTrue(hasattr(self.tool, "name"))
-        self.assertTrue(hasattr(self.tool, "inputs"))
-        self.assertTrue(hasattr(self.tool, "output_type"))
+    assert isinstance(tool.inputs, dict)
+    for input_spec in tool.inputs.values():
+        assert "type" in input_spec
+        assert "description" in input_spec
+        assert input_spec["type"] in AUTHORIZED_TYPES
+        assert isinstance(input_spec["description"], str)
+
+    assert tool.output_type in AUTHORIZED_TYPES
+
+
+class ToolTesterMixin:
+    def test_metadata(self):
+        assert_valid_tool_metadata(self.tool)
 
     def test_agent_type_output(self):
         inputs = create_inputs(self.tool.inputs)
@@ -97,340 +109,340 @@ class ToolTesterMixin:
             self.assertTrue(isinstance(output, agent_type))
 
 
-class ToolTests(unittest.TestCase):
-    def test_tool_init_with_decorator(self):
+@pytest.fixture(scope="session")
+def save_root(tmp_path_factory):
+    return tmp_path_factory.mktemp("tool_saves")
+
+
+def test_tool_init_with_decorator():
+    @tool
+    def coolfunc(a: str, b: int) -> float:
+        """Cool function
+
+        Args:
+            a: The first argument
+            b: The second one
+        """
+        return b + 2, a
+
+    assert coolfunc.output_type == "number"
+
+
+def test_tool_init_vanilla():
+    class HFModelDownloadsTool(Tool):
+        name = "model_download_counter"
+        description = """
+        This is a tool that returns the most downloaded model of a given task on the Hugging Face Hub.
+        It returns the name of the checkpoint."""
+
+        inputs = {
+            "task": {
+                "type": "string",
+                "description": "the task category (such as text-classification, depth-estimation, etc)",
+            }
+        }
+        output_type = "string"
+
+        def forward(self, task: str) -> str:
+            return "best model"
+
+    tool = HFModelDownloadsTool()
+    assert list(tool.inputs.keys())[0] == "task"
+
+
+def test_tool_init_decorator_raises_issues():
+    with pytest.raises(Exception, match="Tool return type not found"):
+
         @tool
-        def coolfunc(a: str, b: int) -> float:
+        def coolfunc(a: str, b: int):
             """Cool function
 
             Args:
                 a: The first argument
                 b: The second one
             """
-            return b + 2, a
+            return a + b
 
         assert coolfunc.output_type == "number"
 
-    def test_tool_init_vanilla(self):
-        class HFModelDownloadsTool(Tool):
-            name = "model_download_counter"
-            description = """
-            This is a tool that returns the most downloaded model of a given task on the Hugging Face Hub.
-            It returns the name of the checkpoint."""
+    with pytest.raises(Exception, match="docstring has no description for the argument"):
 
-            inputs = {
-                "task": {
-                    "type": "string",
-                    "description": "the task category (such as text-classification, depth-estimation, etc)",
-                }
-            }
-            output_type = "string"
+        @tool
+        def coolfunc(a: str, b: int) -> int:
+            """Cool function
 
-            def forward(self, task: str) -> str:
-                return "best model"
+            Args:
+                a: The first argument
+            """
+            return b + a
 
-        tool = HFModelDownloadsTool()
-        assert list(tool.inputs.keys())[0] == "task"
+        assert coolfunc.output_type == "number"
 
-    def test_tool_init_decorator_raises_issues(self):
-        with pytest.raises(Exception) as e:
 
-            @tool
-            def coolfunc(a: str, b: int):
-                """Cool function
+@tool
+def get_current_time() -> str:
+    """
+    Gets the current time.
+    """
+    return str(np.random.random())
 
-                Args:
-                    a: The first argument
-                    b: The second one
-                """
-                return a + b
 
-            assert coolfunc.output_type == "number"
-        assert "Tool return type not found" in str(e)
+class GetCurrentTimeTool(Tool):
+    name = "get_current_time_tool"
+    description = "Gets the current time"
+    inputs = {}
+    output_type = "string"
 
-        with pytest.raises(Exception) as e:
+    def forward(self):
+        return str(np.random.random())
 
-            @tool
-            def coolfunc(a: str, b: int) -> int:
-                """Cool function
 
-                Args:
-                    a: The first argument
-                """
-                return b + a
+class InitArgFailTool(Tool):
+    name = "specific"
+    description = "test description"
+    inputs = {"string_input": {"type": "string", "description": "input description"}}
+    output_type = "string"
 
-            assert coolfunc.output_type == "number"
-        assert "docstring has no description for the argument" in str(e)
+    def __init__(self, url):
+        super().__init__(self)
+        self.url = "none"
 
-    def test_saving_tool_raises_error_imports_outside_function(self):
-        with pytest.raises(Exception) as e:
-            import numpy as np
+    def forward(self, string_input: str) -> str:
+        return self.url + string_input
 
-            @tool
-            def get_current_time() -> str:
-                """
-                Gets the current time.
-                """
-                return str(np.random.random())
 
-            get_current_time.save("output")
+class OutsideImportFailTool(Tool):
+    name = "specific"
+    description = "test description"
+    inputs = {"string_input": {"type": "string", "description": "input description"}}
+    output_type = "string"
 
-        assert "np" in str(e)
+    def useless_method(self):
+        self.client = np.random.random()
+        return ""
 
-        # Also test with classic definition
-        with pytest.raises(Exception) as e:
+    def forward(self, string_input):
+        return self.useless_method() + string_input
 
-            class GetCurrentTimeTool(Tool):
-                name = "get_current_time_tool"
-                description = "Gets the current time"
-                inputs = {}
-                output_type = "string"
 
-                def forward(self):
-                    return str(np.random.random())
+class InsideImportSuccessTool(Tool):
+    name = "specific"
+    description = "test description"
+    inputs = {"string_input": {"type": "string", "description": "input description"}}
+    output_type = "string"
 
-            get_current_time = GetCurrentTimeTool()
-            get_current_time.save("output")
+    def useless_method(self):
+        import numpy as np
 
-        assert "np" in str(e)
+        self.client = np.random.random()
+        return ""
 
-    def test_tool_definition_raises_no_error_imports_in_function(self):
-        @tool
-        def get_current_time() -> str:
-            """
-            Gets the current time.
-            """
+    def forward(self, string_input):
+        return self.useless_method() + string_input
+
+
+@pytest.mark.parametrize("tool_to_save", [get_current_time, GetCurrentTimeTool()], ids=["decorator", "class"])
+def test_saving_tool_raises_error_imports_outside_function(tool_to_save, save_root):
+    with pytest.raises(Exception, match="np"):
+        tool_to_save.save(save_root / "imports_outside_function")
+
+
+def test_tool_definition_raises_no_error_imports_in_function():
+    @tool
+    def get_current_time() -> str:
+        """
+        Gets the current time.
+        """
+        from datetime import datetime
+
+        return str(datetime.now())
+
+    class GetCurrentTimeTool(Tool):
+        name = "get_current_time_tool"
+        description = "Gets the current time"
+        inputs = {}
+        output_type = "string"
+
+        def forward(self):
             from datetime import datetime
 
             return str(datetime.now())
 
-        class GetCurrentTimeTool(Tool):
-            name = "get_current_time_tool"
-            description = "Gets the current time"
-            inputs = {}
-            output_type = "string"
 
-            def forward(self):
-                from datetime import datetime
+def test_saving_tool_allows_no_arg_in_init(save_root):
+    # Test one cannot save tool with additional args in init
+    fail_tool = InitArgFailTool("dummy_url")
+    with pytest.raises(Exception, match="__init__"):
+        fail_tool.save(save_root / "no_arg_in_init")
 
-                return str(datetime.now())
 
-    def test_saving_tool_allows_no_arg_in_init(self):
-        # Test one cannot save tool with additional args in init
-        class FailTool(Tool):
-            name = "specific"
-            description = "test description"
-            inputs = {"string_input": {"type": "string", "description": "input description"}}
-            output_type = "string"
+def test_saving_tool_allows_no_imports_from_outside_methods(save_root):
+    # Test that using imports from outside functions fails
+    fail_tool = OutsideImportFailTool()
+    with pytest.raises(Exception, match="'np' is undefined"):
+        fail_tool.save(save_root / "imports_from_outside_methods")
 
-            def __init__(self, url):
-                super().__init__(self)
-                self.url = "none"
+    # Test that putting these imports inside functions works
+    success_tool = InsideImportSuccessTool()
+    success_tool.save(save_root / "no_imports_from_outside_methods")
 
-            def forward(self, string_input: str) -> str:
-                return self.url + string_input
 
-        fail_tool = FailTool("dummy_url")
-        with pytest.raises(Exception) as e:
-            fail_tool.save("output")
-        assert "__init__" in str(e)
+def test_tool_missing_class_attributes_raises_error():
+    with pytest.raises(Exception, match="You must set an attribute output_type"):
 
-    def test_saving_tool_allows_no_imports_from_outside_methods(self):
-        # Test that using imports from outside functions fails
-        import numpy as np
+        class GetWeatherTool(Tool):
+            name = "get_weather"
+            description = "Get weather in the next days at given location."
+            inputs = {
+                "location": {"type": "string", "description": "the location"},
+                "celsius": {
+                    "type": "string",
+                    "description": "the temperature type",
+                },
+            }
 
-        class FailTool(Tool):
-            name = "specific"
-            description = "test description"
-            inputs = {"string_input": {"type": "string", "description": "input description"}}
-            output_type = "string"
+            def forward(self, location: str, celsius: Optional[bool] = False) -> str:
+                return "The weather is UNGODLY with torrential rains and temperatures below -10°C"
 
-            def useless_method(self):
-                self.client = np.random.random()
-                return ""
+        GetWeatherTool()
 
-            def forward(self, string_input):
-                return self.useless_method() + string_input
 
-        fail_tool = FailTool()
-        with pytest.raises(Exception) as e:
-            fail_tool.save("output")
-        assert "'np' is undefined" in str(e)
+def test_tool_from_decorator_optional_args():
+    @tool
+    def get_weather(location: str, celsius: Optional[bool] = False) -> str:
+        """
+        Get weather in the next days at given location.
+        Secretly this tool does not care about the location, it hates the weather everywhere.
 
-        # Test that putting these imports inside functions works
-        class SuccessTool(Tool):
-            name = "specific"
-            description = "test description"
-            inputs = {"string_input": {"type": "string", "description": "input description"}}
-            output_type = "string"
+        Args:
+            location: the location
+            celsius: the temperature type
+        """
+        return "The weather is UNGODLY with torrential rains and temperatures below -10°C"
 
-            def useless_method(self):
-                import numpy as np
+    assert "nullable" in get_weather.inputs["celsius"]
+    assert get_weather.inputs["celsius"]["nullable"]
+    assert "nullable" not in get_weather.inputs["location"]
 
-                self.client = np.random.random()
-                return ""
 
-            def forward(self, string_input):
-                return self.useless_method() + string_input
+def test_tool_default_parameters_is_nullable():
+    @tool
+    def get_weather(location: str, celsius: bool = False) -> str:
+        """
+        Get weather in the next days at given location.
 
-        success_tool = SuccessTool()
-        success_tool.save("output")
+        Args:
+            location: The location to get the weather for.
+            celsius: is the temperature given in celsius?
+        """
+        return "The weather is UNGODLY with torrential rains and temperatures below -10°C"
 
-    def test_tool_missing_class_attributes_raises_error(self):
-        with pytest.raises(Exception) as e:
+    assert get_weather.inputs["celsius"]["nullable"]
 
-            class GetWeatherTool(Tool):
-                name = "get_weather"
-                description = "Get weather in the next days at given location."
-                inputs = {
-                    "location": {"type": "string", "description": "the location"},
-                    "celsius": {
-                        "type": "string",
-                        "description": "the temperature type",
-                    },
-                }
 
-                def forward(self, location: str, celsius: Optional[bool] = False) -> str:
-                    return "The weather is UNGODLY with torrential rains and temperatures below -10°C"
+def test_tool_supports_any_none(save_root):
+    @tool
+    def get_weather(location: Any) -> None:
+        """
+        Get weather in the next days at given location.
 
-            GetWeatherTool()
-        assert "You must set an attribute output_type" in str(e)
+        Args:
+            location: The location to get the weather for.
+        """
+        return
 
-    def test_tool_from_decorator_optional_args(self):
-        @tool
-        def get_weather(location: str, celsius: Optional[bool] = False) -> str:
-            """
-            Get weather in the next days at given location.
-            Secretly this tool does not care about the location, it hates the weather everywhere.
+    get_weather.save(save_root / "any_none")
+    assert get_weather.inputs["location"]["type"] == "any"
+    assert get_weather.output_type == "null"
 
-            Args:
-                location: the location
-                celsius: the temperature type
-            """
-            return "The weather is UNGODLY with torrential rains and temperatures below -10°C"
-
-        assert "nullable" in get_weather.inputs["celsius"]
-        assert get_weather.inputs["celsius"]["nullable"]
-        assert "nullable" not in get_weather.inputs["location"]
-
-    def test_tool_mismatching_nullable_args_raises_error(self):
-        with pytest.raises(Exception) as e:
-
-            class GetWeatherTool(Tool):
-                name = "get_weather"
-                description = "Get weather in the next days at given location."
-                inputs = {
-                    "location": {"type": "string", "description": "the location"},
-                    "celsius": {
-                        "type": "string",
-                        "description": "the temperature type",
-                    },
-                }
-                output_type = "string"
-
-                def forward(self, location: str, celsius: Optional[bool] = False) -> str:
-                    return "The weather is UNGODLY with torrential rains and temperatures below -10°C"
-
-            GetWeatherTool()
-        assert "Nullable" in str(e)
-
-        with pytest.raises(Exception) as e:
-
-            class GetWeatherTool2(Tool):
-                name = "get_weather"
-                description = "Get weather in the next days at given location."
-                inputs = {
-                    "location": {"type": "string", "description": "the location"},
-                    "celsius": {
-                        "type": "string",
-                        "description": "the temperature type",
-                    },
-                }
-                output_type = "string"
-
-                def forward(self, location: str, celsius: bool = False) -> str:
-                    return "The weather is UNGODLY with torrential rains and temperatures below -10°C"
-
-            GetWeatherTool2()
-        assert "Nullable" in str(e)
-
-        with pytest.raises(Exception) as e:
-
-            class GetWeatherTool3(Tool):
-                name = "get_weather"
-                description = "Get weather in the next days at given location."
-                inputs = {
-                    "location": {"type": "string", "description": "the location"},
-                    "celsius": {
-                        "type": "string",
-                        "description": "the temperature type",
-                        "nullable": True,
-                    },
-                }
-                output_type = "string"
-
-                def forward(self, location, celsius: str) -> str:
-                    return "The weather is UNGODLY with torrential rains and temperatures below -10°C"
-
-            GetWeatherTool3()
-        assert "Nullable" in str(e)
-
-    def test_tool_default_parameters_is_nullable(self):
-        @tool
-        def get_weather(location: str, celsius: bool = False) -> str:
-            """
-            Get weather in the next days at given location.
 
-            Args:
-                location: The location to get the weather for.
-                celsius: is the temperature given in celsius?
-            """
-            return "The weather is UNGODLY with torrential rains and temperatures below -10°C"
+def test_tool_supports_array():
+    @tool
+    def get_weather(locations: List[str], months: Optional[Tuple[str, str]] = None) -> Dict[str, float]:
+        """
+        Get weather in the next days at given locations.
 
-        assert get_weather.inputs["celsius"]["nullable"]
+        Args:
+            locations: The locations to get the weather for.
+            months: The months to get the weather for
+        """
+        return
 
-    def test_tool_supports_any_none(self):
-        @tool
-        def get_weather(location: Any) -> None:
-            """
-            Get weather in the next days at given location.
+    assert get_weather.inputs["locations"]["type"] == "array"
+    assert get_weather.inputs["months"]["type"] == "array"
 
-            Args:
-                location: The location to get the weather for.
-            """
-            return
 
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            get_weather.save(tmp_dir)
-        assert get_weather.inputs["location"]["type"] == "any"
-        assert get_weather.output_type == "null"
+def _make_weather_tool(inputs, forward):
+    return type(
+        "GetWeatherTool",
+        (Tool,),
+        {
+            "name": "get_weather",
+            "description": "Get weather in the next days at given location.",
+            "inputs": inputs,
+            "output_type": "string",
+            "forward": forward,
+        },
+    )
 
-    def test_tool_supports_array(self):
-        @tool
-        def get_weather(locations: List[str], months: Optional[Tuple[str, str]] = None) -> Dict[str, float]:
-            """
-            Get weather in the next days at given locations.
 
-            Args:
-                locations: The locations to get the weather for.
-                months: The months to get the weather for
-            """
-            return
+def _forward_optional_celsius(self, location: str, celsius: Optional[bool] = False) -> str:
+    return "The weather is UNGODLY with torrential rains and temperatures below -10°C"
+
+
+def _forward_default_celsius(self, location: str, celsius: bool = False) -> str:
+    return "The weather is UNGODLY with torrential rains and temperatures below -10°C"
 
-        assert get_weather.inputs["locations"]["type"] == "array"
-        assert get_weather.inputs["months"]["type"] == "array"
+
+def _forward_required_celsius(self, location, celsius: str) -> str:
+    return "The weather is UNGODLY with torrential rains and temperatures below -10°C"
+
+
+_NON_NULLABLE_WEATHER_INPUTS = {
+    "location": {"type": "string", "description": "the location"},
+    "celsius": {"type": "string", "description": "the temperature type"},
+}
+_NULLABLE_WEATHER_INPUTS = {
+    "location": {"type": "string", "description": "the location"},
+    "celsius": {"type": "string", "description": "the temperature type", "nullable": True},
+}
+
+
+@pytest.mark.parametrize(
+    "inputs, forward",
+    [
+        (_NON_NULLABLE_WEATHER_INPUTS, _forward_optional_celsius),
+        (_NON_NULLABLE_WEATHER_INPUTS, _forward_default_celsius),
+        (_NULLABLE_WEATHER_INPUTS, _forward_required_celsius),
+    ],
+    ids=["optional_arg", "default_arg", "nullable_input"],
+)
+def test_tool_mismatching_nullable_args_raises_error(inputs, forward):
+    with pytest.raises(Exception, match="Nullable"):
+        _make_weather_tool(inputs, forward)()
 
 
 @pytest.fixture
 def mock_server_parameters():
-    return MagicMock()
+    import mcp
+
+    return Mock(spec=mcp.StdioServerParameters)
+
+
+class _FakeMCPAdapt:
+    def __init__(self, server_parameters, adapter):
+        pass
+
+    def __enter__(self):
+        return ["tool1", "tool2"]
+
+    def __exit__(self, *args):
+        return None
 
 
 @pytest.fixture
 def mock_mcp_adapt():
-    with patch("mcpadapt.core.MCPAdapt") as mock:
-        mock.return_value.__enter__.return_value = ["tool1", "tool2"]
-        mock.return_value.__exit__.return_value = None
+    with patch("mcpadapt.core.MCPAdapt", new=_FakeMCPAdapt) as mock:
         yield mock
 
 
@@ -440,6 +452,33 @@ def mock_smolagents_adapter():
         yield mock
 
 
+@pytest.fixture(scope="session")
+def mcp_echo_collection():
+    import mcp
+
+    # define the most simple mcp server with one tool that echoes the input text
+    mcp_server_script = dedent("""\
+        from mcp.server.fastmcp import FastMCP
+
+        mcp = FastMCP("Echo Server")
+
+        @mcp.tool()
+        def echo_tool(text: str) -> str:
+            return text
+
+        mcp.run()
+    """).strip()
+
+    mcp_server_params = mcp.StdioServerParameters(
+        command="python",
+        args=["-c", mcp_server_script],
+    )
+
+    # The server subprocess is started once and shared by all MCP integration tests
+    with ToolCollection.from_mcp(mcp_server_params) as tool_collection:
+        yield tool_collection
+
+
 class TestToolCollection:
     def test_from_mcp(self, mock_server_parameters, mock_mcp_adapt, mock_smolagents_adapter):
         with ToolCollection.from_mcp(mock_server_parameters) as tool_collection:
@@ -448,26 +487,8 @@ class TestToolCollection:
             assert "tool1" in tool_collection.tools
             assert "tool2" in tool_collection.tools
 
-    def test_integration_from_mcp(self):
-        # define the most simple mcp server with one tool that echoes the input text
-        mcp_server_script = dedent("""\
-            from mcp.server.fastmcp import FastMCP
-
-            mcp = FastMCP("Echo Server")
-
-            @mcp.tool()
-            def echo_tool(text: str) -> str:
-                return text
-
-            mcp.run()
-        """).strip()
-
-        mcp_server_params = mcp.StdioServerParameters(
-            command="python",
-            args=["-c", mcp_server_script],
-        )
-
-        with ToolCollection.from_mcp(mcp_server_params) as tool_collection:
-            assert len(tool_collection.tools) == 1, "Expected 1 tool"
-            assert tool_collection.tools[0].name == "echo_tool", "Expected tool name to be 'echo_tool'"
-            assert tool_collection.tools[0](text="Hello") == "Hello", "Expected tool to echo the input text"
+    def test_integration_from_mcp(self, mcp_echo_collection):
+        tool_collection = mcp_echo_collection
+        assert len(tool_collection.tools) == 1, "Expected 1 tool"
+        assert tool_collection.tools[0].name == "echo_tool", "Expected tool name to be 'echo_tool'"
+        assert tool_collection.tools[0](text="Hello") == "Hello", "Expected tool to echo the input text"